@@ -1,87 +1,133 @@
 import argparse
+import asyncio
 import csv
 import json
 import logging
-import openpyxl
+import os
+import re
+import shutil
+import tempfile
 import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from typing import Iterator, Iterable, Optional, Dict, List, Union, Any
-from docx import Document
+from io import BytesIO
 from pathlib import Path
-from docx2pdf import convert
-from datetime import datetime
-from reportlab.pdfgen import canvas
-from PyPDF2 import PdfReader, PdfWriter
+from datetime import date, datetime
 
 # Global logger configuration
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
 
+# WordprocessingML tags used for direct placeholder substitution
+W_NS = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+W_P = W_NS + "p"
+W_T = W_NS + "t"
+XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+PLACEHOLDER_RE = re.compile(r"\{[^{}]*\}")
+
+# Rows read ahead of the renderers in fill_contract
+RENDER_QUEUE_SIZE = 8
+
+# Buffer size for streaming csv/jsonl reads
+READ_BUFFER_SIZE = 1 << 20
+
+# CSV files larger than this are parsed with pandas when it is installed
+LARGE_CSV_BYTES = 5_000_000
+
 
 # ---------------------------------------
 # Helper: Normalize header names
 # ---------------------------------------
+@lru_cache(maxsize=4096)
 def normalize_header(header: str) -> str:
     if not header:
         return ""
-    # Normalize special characters (e.g., Turkish to ASCII)
-    header = unicodedata.normalize("NFKD", header).encode("ascii", "ignore").decode("ascii")
+    # Normalize special characters (e.g., Turkish to ASCII); plain ASCII needs no folding
+    if not header.isascii():
+        header = unicodedata.normalize("NFKD", header).encode("ascii", "ignore").decode("ascii")
     # Lowercase and replace spaces with underscores
     return header.strip().lower().replace(" ", "_")
 
 
+# ---------------------------------------
+# Hint the kernel that a file is read sequentially
+# ---------------------------------------
+def _advise_sequential(f) -> None:
+    try:
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except (AttributeError, OSError):
+        # Not available on Windows/macOS
+        pass
+
+
 # ---------------------------------------
 # Date formatting helper
 # ---------------------------------------
 def format_date(value):
-    try:
-        if isinstance(value, str):
+    if isinstance(value, datetime):
+        return value.strftime("%d/%m/%Y")
+    # Zero-padded YYYY-MM-DD -> DD/MM/YYYY by slicing
+    if (
+        isinstance(value, str) and len(value) == 10 and value[4] == "-" and value[7] == "-"
+        and value[:4].isdigit() and value[5:7].isdigit() and value[8:].isdigit()
+    ):
+        # Impossible dates (month 13, Feb 30, year 0) are left as-is, like strptime did
+        try:
+            date(int(value[:4]), int(value[5:7]), int(value[8:]))
+        except ValueError:
+            return value
+        return f"{value[8:10]}/{value[5:7]}/{value[0:4]}"
+    # Other shapes (e.g. 2024-1-5) go through strptime; non-dates are returned unchanged
+    if isinstance(value, str):
+        try:
             return datetime.strptime(value, "%Y-%m-%d").strftime("%d/%m/%Y")
-        elif isinstance(value, datetime):
-            return value.strftime("%d/%m/%Y")
-        else:
+        except ValueError:
             return value
-    except Exception:
-        return str(value)
+    return value
 
 
 # ---------------------------------------
 # Add logo to PDF (overlay on first page)
 # ---------------------------------------
 def add_logo_to_pdf(pdf_path, logo_path, output_path):
-    reader = PdfReader(pdf_path)
+    from reportlab.pdfgen import canvas
+    from PyPDF2 import PdfReader, PdfWriter
+
+    # Load the source pdf once into memory so it is parsed from a single read
+    reader = PdfReader(BytesIO(Path(pdf_path).read_bytes()))
     writer = PdfWriter()
 
     first_page = reader.pages[0]
     width = float(first_page.mediabox.width)
     height = float(first_page.mediabox.height)
 
-    overlay_path = Path(output_path).with_name(Path(output_path).stem + "_overlay.pdf")
-    c = canvas.Canvas(str(overlay_path), pagesize=(width, height))
+    # Draw the logo overlay in memory instead of a temporary file
+    overlay_buf = BytesIO()
+    c = canvas.Canvas(overlay_buf, pagesize=(width, height))
     c.drawImage(logo_path, 50, height - 100, width=120, preserveAspectRatio=True, mask='auto')
     c.save()
+    overlay_buf.seek(0)
 
-    overlay_reader = PdfReader(str(overlay_path))
+    overlay_reader = PdfReader(overlay_buf)
     overlay_page = overlay_reader.pages[0]
     first_page.merge_page(overlay_page)
 
-    writer.add_page(first_page)
-    for page in reader.pages[1:]:
-        writer.add_page(page)
+    # first_page was merged in place, so copy the whole reader in one call
+    writer.append_pages_from_reader(reader)
 
     with open(output_path, "wb") as f_out:
         writer.write(f_out)
 
-    overlay_path.unlink(missing_ok=True)
-
 
 # ---------------------------------------
-# Read data from CSV, Excel, JSON, JSONL
+# Shared reader for CSV, Excel, JSON, JSONL
+# mode: "iter" (lazy rows), "list" (all rows) or "frame" (pandas DataFrame)
 # ---------------------------------------
-def read_data(
+def _read_data(
     file_path: str,
     *,
-    as_list: bool = False,
-    return_dataframe: bool = False,
+    mode: str = "iter",
     normalize_headers: bool = True,
     column_map: Optional[Dict[str, str]] = None,
     required_fields: Optional[Iterable[str]] = None,
@@ -91,7 +137,7 @@ def read_data(
     csv_delimiter: str = ",",
     invalid_sink_path: Optional[str] = "Errors/errors.json",
     progress: bool = True,
-) -> Union[Iterator[Dict[str, Any]], List[Dict[str, Any]]]:
+) -> Any:
 
     def log(level: str, msg: str):
         if logger:
@@ -104,9 +150,11 @@ def read_data(
     colmap = {normalize_header(k): v for k, v in (column_map or {}).items()}
     req = tuple(normalize_header(f) for f in (required_fields or ()))
     date_keys = tuple(normalize_header(f) for f in (date_fields or ()))
-    invalid_rows: list[dict] = []
-    want_list = bool(as_list or return_dataframe)
-    out_rows: list[dict] | None = [] if want_list else None
+    # Invalid rows are streamed to an append-only NDJSON sink, opened on the first one
+    invalid_count = 0
+    invalid_fp = None
+    sink_failed = False
+    sink = (Path(invalid_sink_path) if invalid_sink_path else path.with_suffix(".invalid.json")).with_suffix(".jsonl")
 
     iter_wrap = (lambda it: it)
     if progress:
@@ -116,13 +164,18 @@ def read_data(
         except Exception:
             log("warning", "tqdm not available; continuing without progress bar.")
 
-    def normalize_row(raw: dict) -> dict:
-        row = {}
-        for k, v in raw.items():
-            new_key = normalize_header(str(k)) if k else ""
-            if colmap:
-                new_key = colmap.get(new_key, new_key)
-            row[new_key] = v.strip() if isinstance(v, str) else v
+    def header_keys(headers: Iterable[Any]) -> list[str]:
+        # Normalize + column-map the header row once instead of per cell
+        keys = [normalize_header(str(h)) if h is not None else "" for h in headers]
+        if colmap:
+            keys = [colmap.get(k, k) for k in keys]
+        return keys
+
+    def build_row(keys: list[str], values: Iterable[Any]) -> dict:
+        row = {k: (v.strip() if isinstance(v, str) else v) for k, v in zip(keys, values)}
+        return apply_dates(row)
+
+    def apply_dates(row: dict) -> dict:
         if date_formatter and date_keys:
             for dk in date_keys:
                 if dk in row and row[dk]:
@@ -135,52 +188,112 @@ def read_data(
                         log("warning", f"date_formatter {dk} error: {e}")
         return row
 
+    def normalize_row(raw: dict) -> dict:
+        return build_row(header_keys(raw.keys()), raw.values())
+
     def is_valid(row: dict) -> tuple[bool, list[str]]:
         missing = [f for f in req if not row.get(f)]
         return (len(missing) == 0, missing)
 
-    def emit_row(row: dict):
-        if want_list:
-            out_rows.append(row)  # type: ignore[arg-type]
-        else:
-            return row
-
     def record_invalid_sink(row: dict, reason: list[str]):
         row_copy = dict(row)
         row_copy["_errors"] = reason
-        invalid_rows.append(row_copy)
+        write_invalid_sink(row_copy)
+
+    def load_dataframe(pd) -> Any:
+        # Let pandas parse the file in C and validate column-wise
+        if suffix == ".csv":
+            # Blank cells stay "" like in the row-based csv reader
+            df = pd.read_csv(path, encoding=csv_encoding, sep=csv_delimiter, dtype=str, keep_default_na=False)
+            # Short rows still leave NaN for their missing trailing cells
+            df = df.fillna("").apply(lambda col: col.str.strip())
+        else:
+            df = pd.read_excel(path, engine="openpyxl")
+            df = df.apply(lambda col: col.map(lambda v: v.strip() if isinstance(v, str) else v)
+                          if col.dtype == object else col)
+
+        df.columns = header_keys(df.columns)
+        blank = df.isna() | df.eq("")
+        keep = ~blank.all(axis=1)
+        df, blank = df[keep], blank[keep]
+
+        if req:
+            missing = pd.DataFrame({f: blank[f] if f in blank else True for f in req}, index=df.index)
+            bad = missing.any(axis=1)
+            for idx in df.index[bad]:
+                rec = df.loc[idx]
+                row = rec.astype(object).where(rec.notna(), None).to_dict()
+                record_invalid_sink(row, [f"missing: {f}" for f in req if missing.at[idx, f]])
+            df = df[~bad]
+
+        return df.reset_index(drop=True)
 
     def read_csv() -> Iterator[dict]:
-        with path.open(newline="", encoding=csv_encoding) as f:
-            rdr = csv.DictReader(f, delimiter=csv_delimiter)
-            for raw in iter_wrap(rdr):
-                if not raw or not any(raw.values()):
+        # Large files read into a list: pandas' C parser beats the per-cell Python loop.
+        # Lazy iteration keeps streaming so memory and read-ahead stay bounded.
+        if mode == "list" and path.stat().st_size > LARGE_CSV_BYTES:
+            try:
+                import pandas as pd
+            except ImportError:
+                pd = None
+            if pd is not None:
+                try:
+                    df = load_dataframe(pd)
+                except pd.errors.ParserError as e:
+                    # Ragged rows (extra fields) are handled by the csv.reader loop below
+                    log("warning", f"pandas could not parse {path.name}, reading row by row: {e}")
+                else:
+                    for row in df.to_dict(orient="records"):
+                        yield apply_dates(row)
+                    return
+
+        with path.open(newline="", encoding=csv_encoding, buffering=READ_BUFFER_SIZE) as f:
+            _advise_sequential(f)
+            rdr = csv.reader(f, delimiter=csv_delimiter)
+            header_row = next(rdr, None)
+            if header_row is None:
+                return
+            keys = header_keys(header_row)
+            for row_vals in iter_wrap(rdr):
+                if not any(row_vals):
                     continue
-                row = normalize_row(raw)
+                # Pad short rows so missing trailing cells read as "", like the pandas paths
+                if len(row_vals) < len(keys):
+                    row_vals += [""] * (len(keys) - len(row_vals))
+                row = build_row(keys, row_vals)
                 ok, missing = is_valid(row)
                 if not ok:
                     record_invalid_sink(row, [f"missing: {m}" for m in missing])
                     continue
-                yielded = emit_row(row)
-                if yielded is not None:
-                    yield yielded
+                yield row
 
     def read_xlsx() -> Iterator[dict]:
+        import openpyxl
+
         wb = openpyxl.load_workbook(path, read_only=True, data_only=True)
-        ws = wb.active
-        headers = [("" if c.value is None else str(c.value)) for c in ws[1]]
-        for row_vals in iter_wrap(ws.iter_rows(min_row=2, values_only=True)):
-            if not row_vals or not any(row_vals):
-                continue
-            raw = dict(zip(headers, row_vals))
-            row = normalize_row(raw)
-            ok, missing = is_valid(row)
-            if not ok:
-                record_invalid_sink(row, [f"missing: {m}" for m in missing])
-                continue
-            yielded = emit_row(row)
-            if yielded is not None:
-                yield yielded
+        try:
+            ws = wb.active
+            # Some writers store a bogus A1:A1 dimension; rescan the sheet in that case
+            try:
+                if ws.calculate_dimension() == "A1:A1":
+                    ws.reset_dimensions()
+            except ValueError:
+                ws.reset_dimensions()
+            header_row = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), None)
+            if header_row is None:
+                return
+            keys = header_keys(header_row)
+            for row_vals in iter_wrap(ws.iter_rows(min_row=2, values_only=True)):
+                if not any(row_vals):
+                    continue
+                row = build_row(keys, row_vals)
+                ok, missing = is_valid(row)
+                if not ok:
+                    record_invalid_sink(row, [f"missing: {m}" for m in missing])
+                    continue
+                yield row
+        finally:
+            wb.close()
 
     def read_json() -> Iterator[dict]:
         with path.open(encoding="utf-8") as f:
@@ -197,79 +310,175 @@ def read_data(
             if not ok:
                 record_invalid_sink(row, [f"missing: {m}" for m in missing])
                 continue
-            yielded = emit_row(row)
-            if yielded is not None:
-                yield yielded
+            yield row
 
     def read_jsonl() -> Iterator[dict]:
-        with path.open(encoding="utf-8") as f:
+        try:
+            from orjson import loads
+        except ImportError:
+            loads = json.loads
+        with path.open("rb", buffering=READ_BUFFER_SIZE) as f:
+            _advise_sequential(f)
             for line in iter_wrap(f):
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    raw = json.loads(line)
+                    raw = loads(line)
                 except Exception as e:
-                    record_invalid_sink({"_raw": line}, [f"json_decode:{e}"])
+                    record_invalid_sink({"_raw": line.decode("utf-8", "replace")}, [f"json_decode:{e}"])
                     continue
                 if not isinstance(raw, dict):
-                    record_invalid_sink({"_raw": line}, ["json_not_object"])
+                    record_invalid_sink({"_raw": line.decode("utf-8", "replace")}, ["json_not_object"])
                     continue
                 row = normalize_row(raw)
                 ok, missing = is_valid(row)
                 if not ok:
                     record_invalid_sink(row, [f"missing: {m}" for m in missing])
                     continue
-                yielded = emit_row(row)
-                if yielded is not None:
-                    yield yielded
+                yield row
 
     try:
-        if suffix == ".csv":
-            iterator = read_csv()
-        elif suffix == ".xlsx":
-            iterator = read_xlsx()
-        elif suffix == ".json":
-            iterator = read_json()
-        elif suffix == ".jsonl":
-            iterator = read_jsonl()
-        else:
-            raise ValueError("Unsupported file format. Use .csv, .xlsx, .json or .jsonl")
-
-        if want_list:
-            for _ in iterator:
-                pass
-        else:
-            for item in iterator:
-                yield item
-
-    except FileNotFoundError:
-        log("error", f"File not found: {file_path}")
-    except PermissionError:
-        log("error", f"Permission denied: {file_path}")
-    except Exception as e:
-        log("error", f"Unexpected error while reading {file_path}: {e}")
-
-    if invalid_rows:
-        sink = Path(invalid_sink_path) if invalid_sink_path else path.with_suffix(".invalid.json")
-        sink.parent.mkdir(parents=True, exist_ok=True)
+        from orjson import dumps
+
+        def dump_line(row: dict) -> bytes:
+            return dumps(row, default=str) + b"\n"
+    except ImportError:
+        def dump_line(row: dict) -> bytes:
+            return (json.dumps(row, ensure_ascii=False, default=str) + "\n").encode("utf-8")
+
+    def write_invalid_sink(row: dict):
+        nonlocal invalid_fp, invalid_count, sink_failed
+        invalid_count += 1
+        if sink_failed:
+            return
         try:
-            sink.write_text(json.dumps(invalid_rows, ensure_ascii=False, indent=2), encoding="utf-8")
-            log("warning", f"{len(invalid_rows)} invalid rows saved to {sink}")
+            if invalid_fp is None:
+                sink.parent.mkdir(parents=True, exist_ok=True)
+                invalid_fp = sink.open("ab")
+            invalid_fp.write(dump_line(row))
         except Exception as e:
+            sink_failed = True
             log("error", f"Could not write invalid rows to {sink}: {e}")
 
-    if return_dataframe:
+    def close_invalid_sink():
+        nonlocal invalid_fp
+        if invalid_fp is not None:
+            invalid_fp.close()
+            invalid_fp = None
+            log("warning", f"{invalid_count} invalid rows saved to {sink}")
+
+    def run() -> Iterator[dict]:
         try:
-            import pandas as pd
+            if suffix == ".csv":
+                iterator = read_csv()
+            elif suffix == ".xlsx":
+                iterator = read_xlsx()
+            elif suffix == ".json":
+                iterator = read_json()
+            elif suffix == ".jsonl":
+                iterator = read_jsonl()
+            else:
+                raise ValueError("Unsupported file format. Use .csv, .xlsx, .json or .jsonl")
+
+            yield from iterator
+
+        except FileNotFoundError:
+            log("error", f"File not found: {file_path}")
+        except PermissionError:
+            log("error", f"Permission denied: {file_path}")
         except Exception as e:
-            log("error", f"pandas not available for return_dataframe=True: {e}")
-            return out_rows if as_list else []
-        df = pd.DataFrame(out_rows)
+            log("error", f"Unexpected error while reading {file_path}: {e}")
+        finally:
+            close_invalid_sink()
+
+    def read_dataframe(pd) -> Any:
+        try:
+            df = load_dataframe(pd)
+        except pd.errors.ParserError as e:
+            # Ragged rows (extra fields): build the frame from the csv.reader rows instead
+            log("warning", f"pandas could not parse {path.name}, reading row by row: {e}")
+            return pd.DataFrame(list(run()))
+        except FileNotFoundError:
+            log("error", f"File not found: {file_path}")
+            return pd.DataFrame()
+        except PermissionError:
+            log("error", f"Permission denied: {file_path}")
+            return pd.DataFrame()
+        except Exception as e:
+            log("error", f"Unexpected error while reading {file_path}: {e}")
+            return pd.DataFrame()
+        finally:
+            close_invalid_sink()
         return df
 
+    if mode == "frame":
+        import pandas as pd
+
+        if suffix in (".csv", ".xlsx") and not (date_formatter and date_keys):
+            return read_dataframe(pd)
+        return pd.DataFrame(list(run()))
+    if mode == "list":
+        return list(run())
+    return run()
+
+
+# ---------------------------------------
+# Stream valid rows (same options as read_data)
+# ---------------------------------------
+def read_data_iter(file_path: str, **options: Any) -> Iterator[Dict[str, Any]]:
+    return _read_data(file_path, mode="iter", **options)
+
+
+# ---------------------------------------
+# Read all valid rows into a list (same options as read_data)
+# ---------------------------------------
+def read_data_list(file_path: str, **options: Any) -> List[Dict[str, Any]]:
+    return _read_data(file_path, mode="list", **options)
+
+
+# ---------------------------------------
+# Read data from CSV, Excel, JSON, JSONL
+# ---------------------------------------
+def read_data(
+    file_path: str,
+    *,
+    as_list: bool = False,
+    return_dataframe: bool = False,
+    normalize_headers: bool = True,
+    column_map: Optional[Dict[str, str]] = None,
+    required_fields: Optional[Iterable[str]] = None,
+    date_fields: Optional[Iterable[str]] = None,
+    date_formatter: Optional[Any] = None,
+    csv_encoding: str = "utf-8",
+    csv_delimiter: str = ",",
+    invalid_sink_path: Optional[str] = "Errors/errors.json",
+    progress: bool = True,
+) -> Union[Iterator[Dict[str, Any]], List[Dict[str, Any]]]:
+    options = dict(
+        normalize_headers=normalize_headers,
+        column_map=column_map,
+        required_fields=required_fields,
+        date_fields=date_fields,
+        date_formatter=date_formatter,
+        csv_encoding=csv_encoding,
+        csv_delimiter=csv_delimiter,
+        invalid_sink_path=invalid_sink_path,
+        progress=progress,
+    )
+
+    if return_dataframe:
+        try:
+            import pandas  # noqa: F401
+        except Exception as e:
+            logger.error(f"pandas not available for return_dataframe=True: {e}")
+            return read_data_list(file_path, **options) if as_list else []
+        return _read_data(file_path, mode="frame", **options)
+
     if as_list:
-        return out_rows
+        return read_data_list(file_path, **options)
+
+    return read_data_iter(file_path, **options)
 
 
 # ---------------------------------------
@@ -282,46 +491,236 @@ def build_filename(data: dict, out_dir: str | Path) -> Path:
 
 
 # ---------------------------------------
-# Fill contract template with client data
+# Join placeholders split across runs (once per template)
 # ---------------------------------------
-def fill_contract(template_path, data_file, out_dir, logo_path=None):
-    Path(out_dir).mkdir(parents=True, exist_ok=True)
-    for data in read_data(data_file):
-        doc = Document(template_path)
-
-        # 🔹 Replace placeholders in paragraphs (keeping style)
-        for p in doc.paragraphs:
-            for key, value in data.items():
-                placeholder = "{" + key + "}"
-                if placeholder in p.text:
-                    for run in p.runs:
-                        if placeholder in run.text:
-                            run.text = run.text.replace(placeholder, str(value))
-
-        # 🔹 Replace placeholders in tables (keeping style)
-        for table in doc.tables:
-            for row in table.rows:
-                for cell in row.cells:
-                    for p in cell.paragraphs:
-                        for key, value in data.items():
-                            placeholder = "{" + key + "}"
-                            if placeholder in p.text:
-                                for run in p.runs:
-                                    if placeholder in run.text:
-                                        run.text = run.text.replace(placeholder, str(value))
+def _merge_split_placeholders(doc) -> None:
+    for p in doc.element.iter(W_P):
+        # Only this paragraph's own text nodes (skip nested text boxes)
+        nodes = [t for t in p.iter(W_T) if next(t.iterancestors(W_P)) is p]
+        if len(nodes) < 2:
+            continue
+        texts = [t.text or "" for t in nodes]
+        full = "".join(texts)
+        if "{" not in full:
+            continue
+        owner = [i for i, txt in enumerate(texts) for _ in txt]
+        changed = False
+        for m in PLACEHOLDER_RE.finditer(full):
+            first = owner[m.start()]
+            if owner[m.end() - 1] != first:
+                owner[m.start():m.end()] = [first] * (m.end() - m.start())
+                changed = True
+        if not changed:
+            continue
+        new_texts = [""] * len(nodes)
+        for ch, i in zip(full, owner):
+            new_texts[i] += ch
+        for t, old, new in zip(nodes, texts, new_texts):
+            if old != new:
+                t.text = new
+                t.set(XML_SPACE, "preserve")
 
-        out_docx = build_filename(data, out_dir)
-        doc.save(str(out_docx))
 
-        out_pdf = str(out_docx).replace(".docx", ".pdf")
-        convert(str(out_docx), out_pdf)
+# ---------------------------------------
+# Render a single contract docx
+# ---------------------------------------
+def _render_one(data, template_bytes, out_dir, placeholders):
+    from docx import Document
+
+    doc = Document(BytesIO(template_bytes))
+
+    # 🔹 Build one pattern matching only the placeholders the template uses
+    mapping = {ph: str(data[ph[1:-1]]) for ph in placeholders if ph[1:-1] in data}
+    pattern = re.compile("|".join(map(re.escape, mapping)))
+
+    # 🔹 Replace placeholders directly on <w:t> nodes (paragraphs and tables, keeping style)
+    if mapping:
+        for t in doc.element.iter(W_T):
+            txt = t.text
+            if txt and "{" in txt:
+                new = pattern.sub(lambda m: mapping[m.group(0)], txt)
+                if new != txt:
+                    t.text = new
+                    t.set(XML_SPACE, "preserve")
+
+    out_docx = build_filename(data, out_dir)
+    doc.save(str(out_docx))
+    return out_docx
+
 
-        if logo_path:
-            final_pdf = out_pdf.replace(".pdf", "_with_logo.pdf")
-            add_logo_to_pdf(out_pdf, logo_path, final_pdf)
-            Path(out_pdf).unlink(missing_ok=True)
-            out_pdf = final_pdf
+# ---------------------------------------
+# Post-process a converted pdf (logo overlay)
+# ---------------------------------------
+def _final_pdf_path(out_docx, logo_path=None) -> str:
+    out_pdf = str(out_docx).replace(".docx", ".pdf")
+    return out_pdf.replace(".pdf", "_with_logo.pdf") if logo_path else out_pdf
+
+
+def _finish_pdf(data, out_docx, logo_path=None):
+    out_pdf = str(out_docx).replace(".docx", ".pdf")
 
+    if logo_path:
+        final_pdf = _final_pdf_path(out_docx, logo_path)
+        add_logo_to_pdf(out_pdf, logo_path, final_pdf)
+        Path(out_pdf).unlink(missing_ok=True)
+        out_pdf = final_pdf
+
+    print(f"[OK] Contract created for {data.get('name', '?')} {data.get('surname', '?')}: {out_pdf}")
+    return out_pdf
+
+
+# ---------------------------------------
+# Pipeline: read rows while rendering previous ones
+# ---------------------------------------
+async def _render_pipeline(rows: Iterator[dict], render, workers: int) -> list[tuple[dict, Path]]:
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=RENDER_QUEUE_SIZE)
+    done = object()
+    results: list[tuple[int, dict, Path]] = []
+    numbered = enumerate(rows)
+
+    async def produce():
+        # Pull rows in a thread so file parsing doesn't block the event loop
+        while (item := await asyncio.to_thread(next, numbered, done)) is not done:
+            await queue.put(item)
+        # Not in a finally: awaiting put() while cancelled would block forever on a full queue
+        for _ in range(workers):
+            await queue.put(done)
+
+    async def consume(executor):
+        while (item := await queue.get()) is not done:
+            i, data = item
+            out_docx = await loop.run_in_executor(executor, render, data)
+            results.append((i, data, out_docx))
+
+    # A single worker renders in the default thread pool; more use separate processes
+    executor = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    tasks = [asyncio.create_task(produce())]
+    tasks += [asyncio.create_task(consume(executor)) for _ in range(workers)]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        # A failed render must stop the producer and the other consumers too
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    results.sort(key=lambda r: r[0])
+    return [(data, out_docx) for _, data, out_docx in results]
+
+
+# ---------------------------------------
+# Fill contract template with client data
+# ---------------------------------------
+def fill_contract(template_path, data_file, out_dir, logo_path=None, workers: Optional[int] = None):
+    from docx import Document
+    from docx2pdf import convert
+
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    # Parse and normalize the template once; each row re-opens it from memory
+    template = Document(template_path)
+    _merge_split_placeholders(template)
+    buf = BytesIO()
+    template.save(buf)
+    template_bytes = buf.getvalue()
+    # Placeholders sit in a single <w:t> after merging, so collect them once here
+    placeholders = frozenset(
+        m.group(0)
+        for t in template.element.iter(W_T) if t.text and "{" in t.text
+        for m in PLACEHOLDER_RE.finditer(t.text)
+    )
+    # Render into a fresh staging folder so the batch conversion only sees this run's files
+    staging = Path(tempfile.mkdtemp(prefix=".render_", dir=out_dir))
+    render = partial(_render_one, template_bytes=template_bytes, out_dir=staging, placeholders=placeholders)
+
+    # docx2pdf drives Word/LibreOffice per file, so keep half the cores free
+    if workers is None:
+        workers = max(1, (os.cpu_count() or 2) // 2)
+
+    # 🔹 Each output name and each distinct content is rendered once in the pipeline, so no
+    #    two workers write the same file; the last row per name wins, as before
+    ordered = sorted(placeholders)
+    # Keyed on the casefolded file name: Ali_Veli.docx and ali_veli.docx are one file on
+    # Windows/macOS, so they must never render concurrently or both survive
+    latest: dict[str, tuple[dict, tuple]] = {}
+    dispatched: dict[str, tuple[str, tuple]] = {}
+    dispatched_keys: set[tuple] = set()
+
+    def unique_rows(rows: Iterator[dict]) -> Iterator[dict]:
+        for data in rows:
+            key = tuple(str(data[ph[1:-1]]) if ph[1:-1] in data else None for ph in ordered)
+            name = build_filename(data, out_dir).name
+            folded = name.casefold()
+            latest[folded] = (data, key)
+            if folded in dispatched:
+                if dispatched[folded][1] == key:
+                    logger.info(f"Duplicate row skipped: {name}")
+            elif key not in dispatched_keys:
+                dispatched[folded] = (name, key)
+                dispatched_keys.add(key)
+                yield data
+
+    try:
+        # 🔹 Read rows and render docx files concurrently
+        asyncio.run(_render_pipeline(unique_rows(read_data_iter(data_file)), render, workers))
+
+        # 🔹 Settle each output name on its last row: keep the rendered file, copy an identical
+        #    contract after conversion, or render it now (serially) if neither applies
+        sources = {
+            key: dispatched[folded][0]
+            for folded, (_, key) in latest.items()
+            if folded in dispatched and dispatched[folded][1] == key
+        }
+        rendered: list[tuple[dict, Path]] = []
+        copies: list[tuple[dict, str]] = []
+        for folded, (data, key) in latest.items():
+            staged_name, staged_key = dispatched.get(folded, (None, None))
+            if staged_key == key:
+                rendered.append((data, staging / staged_name))
+                continue
+            # Drop a stale render of this name so the batch conversion skips it
+            if staged_name is not None:
+                (staging / staged_name).unlink(missing_ok=True)
+            if key in sources:
+                copies.append((data, sources[key]))
+            else:
+                out_docx = render(data)
+                rendered.append((data, out_docx))
+                dispatched[folded] = (out_docx.name, key)
+                sources[key] = out_docx.name
+
+        # 🔹 Convert in one Word/LibreOffice session when there is more than one file
+        if len(rendered) > 1:
+            convert(str(staging))
+        else:
+            for _, out_docx in rendered:
+                convert(str(out_docx), str(out_docx).replace(".docx", ".pdf"))
+
+        # 🔹 Move this run's docx/pdf files from the staging folder into out_dir
+        finished: list[tuple[dict, Path]] = []
+        for data, staged in rendered:
+            out_docx = Path(out_dir) / staged.name
+            os.replace(staged, out_docx)
+            staged_pdf = staged.with_suffix(".pdf")
+            if staged_pdf.exists():
+                os.replace(staged_pdf, out_docx.with_suffix(".pdf"))
+            finished.append((data, out_docx))
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+    for data, out_docx in finished:
+        _finish_pdf(data, out_docx, logo_path)
+
+    for data, source in copies:
+        source = Path(out_dir) / source
+        out_docx = build_filename(data, out_dir)
+        out_pdf = _final_pdf_path(out_docx, logo_path)
+        shutil.copyfile(source, out_docx)
+        shutil.copyfile(_final_pdf_path(source, logo_path), out_pdf)
         print(f"[OK] Contract created for {data.get('name', '?')} {data.get('surname', '?')}: {out_pdf}")
 
 
@@ -334,6 +733,7 @@ def main():
     parser.add_argument("--data", "-d", default="client.xlsx", help="Path to data file")
     parser.add_argument("--out", "-o", default="contract", help="Path to output directory")
     parser.add_argument("--logo", "-l", default=None, help="Path to logo file")
+    parser.add_argument("--workers", "-w", type=int, default=None, help="Number of parallel workers (default: half the CPUs)")
 
     args = parser.parse_args()
 
@@ -345,7 +745,7 @@ def main():
         print(f"[ERROR] Data file not found: {args.data}")
         return
 
-    fill_contract(args.template, args.data, args.out, args.logo)
+    fill_contract(args.template, args.data, args.out, args.logo, workers=args.workers)
 
 
 if __name__ == "__main__":
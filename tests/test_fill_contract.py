@@ -0,0 +1,132 @@
+import sys
+import threading
+import types
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("docx")
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import contractfillercli  # noqa: E402
+
+TEMPLATE = ROOT / "contract_template (2).docx"
+
+
+@pytest.fixture(autouse=True)
+def converted(monkeypatch):
+    # docx2pdf needs Word/LibreOffice; write empty PDFs and record which docx files were converted
+    names = []
+
+    def convert(src, dst=None):
+        for docx in sorted(Path(src).glob("*.docx")) if dst is None else [Path(src)]:
+            docx.with_suffix(".pdf").write_bytes(b"")
+            names.append(docx.name)
+
+    module = types.ModuleType("docx2pdf")
+    module.convert = convert
+    monkeypatch.setitem(sys.modules, "docx2pdf", module)
+    return names
+
+
+@pytest.fixture
+def renders(monkeypatch):
+    # Count renders; the thread pool (workers=1) keeps the wrapper out of pickling
+    names = []
+    render_one = contractfillercli._render_one
+
+    def counting(data, *args, **kwargs):
+        out_docx = render_one(data, *args, **kwargs)
+        names.append(out_docx.name)
+        return out_docx
+
+    monkeypatch.setattr(contractfillercli, "_render_one", counting)
+    return names
+
+
+def run_fill(tmp_path, rows, text="{company}", workers=1):
+    from docx import Document
+
+    template = tmp_path / "template.docx"
+    doc = Document()
+    doc.add_paragraph(text)
+    doc.save(template)
+    data = tmp_path / "clients.csv"
+    data.write_text("name,surname,company\n" + "\n".join(rows) + "\n", encoding="utf-8")
+    out = tmp_path / "out"
+    contractfillercli.fill_contract(str(template), str(data), str(out), workers=workers)
+    return out
+
+
+def contents(out):
+    from docx import Document
+
+    return {p.name: Document(p).paragraphs[0].text for p in sorted(out.glob("*.docx"))}
+
+
+def pdfs(out):
+    return sorted(p.name for p in out.glob("*.pdf"))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_render_failure_does_not_hang(tmp_path, workers):
+    rows = ["a/b,x"] + [f"n{i},s{i}" for i in range(contractfillercli.RENDER_QUEUE_SIZE * 5)]
+    data = tmp_path / "clients.csv"
+    data.write_text("name,surname\n" + "\n".join(rows) + "\n", encoding="utf-8")
+
+    outcome = {}
+
+    def run():
+        try:
+            contractfillercli.fill_contract(str(TEMPLATE), str(data), str(tmp_path / "out"), workers=workers)
+        except Exception as e:
+            outcome["error"] = e
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    thread.join(timeout=60)
+
+    assert not thread.is_alive(), "fill_contract hung after a failed render"
+    assert isinstance(outcome.get("error"), FileNotFoundError)
+
+
+def test_names_differing_only_in_case_render_one_file(tmp_path):
+    out = run_fill(tmp_path, ["Ali,Veli,X", "ali,veli,Y"], text="{name} {surname} {company}", workers=2)
+
+    assert {name.casefold(): text for name, text in contents(out).items()} == {"ali_veli.docx": "ali veli Y"}
+
+
+def test_same_name_and_content_is_rendered_once(tmp_path, renders, converted):
+    out = run_fill(tmp_path, ["P,P,K1", "P,P,K1"])
+
+    assert renders == ["P_P.docx"]
+    assert converted == ["P_P.docx"]
+    assert contents(out) == {"P_P.docx": "K1"}
+
+
+def test_same_content_under_another_name_is_copied(tmp_path, renders, converted):
+    out = run_fill(tmp_path, ["A,A,K", "B,B,K"])
+
+    assert renders == ["A_A.docx"]
+    assert converted == ["A_A.docx"]
+    assert contents(out) == {"A_A.docx": "K", "B_B.docx": "K"}
+    assert pdfs(out) == ["A_A.pdf", "B_B.pdf"]
+
+
+def test_later_row_for_a_rendered_name_is_rerendered(tmp_path, renders, converted):
+    out = run_fill(tmp_path, ["P,P,K1", "P,P,K2"])
+
+    assert renders == ["P_P.docx", "P_P.docx"]
+    assert converted == ["P_P.docx"]
+    assert contents(out) == {"P_P.docx": "K2"}
+
+
+def test_stale_render_is_not_converted_when_copied(tmp_path, renders, converted):
+    out = run_fill(tmp_path, ["P,P,K1", "Q,Q,K2", "R,R,K3", "P,P,K2"])
+
+    assert sorted(renders) == ["P_P.docx", "Q_Q.docx", "R_R.docx"]
+    assert converted == ["Q_Q.docx", "R_R.docx"]
+    assert contents(out) == {"P_P.docx": "K2", "Q_Q.docx": "K2", "R_R.docx": "K3"}
+    assert pdfs(out) == ["P_P.pdf", "Q_Q.pdf", "R_R.pdf"]
@@ -0,0 +1,29 @@
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from contractfillercli import format_date  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2025-01-02", "02/01/2025"),
+        ("2024-1-5", "05/01/2024"),
+        ("2024-12-5", "05/12/2024"),
+        ("2025-13-45", "2025-13-45"),
+        ("2025-02-30", "2025-02-30"),
+        ("0000-01-01", "0000-01-01"),
+        ("abc", "abc"),
+        ("", ""),
+        (5, 5),
+        (datetime(2025, 3, 4), "04/03/2025"),
+    ],
+)
+def test_format_date(value, expected):
+    assert format_date(value) == expected
@@ -0,0 +1,71 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import contractfillercli  # noqa: E402
+from contractfillercli import read_data, read_data_list  # noqa: E402
+
+RAGGED_CSV = "name,surname\na,b\nc,d,extra\ne,f\n"
+RAGGED_ROWS = [
+    {"name": "a", "surname": "b"},
+    {"name": "c", "surname": "d"},
+    {"name": "e", "surname": "f"},
+]
+
+
+@pytest.fixture
+def ragged_csv(tmp_path):
+    path = tmp_path / "clients.csv"
+    path.write_text(RAGGED_CSV, encoding="utf-8")
+    return path
+
+
+def read_options(tmp_path):
+    return dict(invalid_sink_path=str(tmp_path / "errors.json"), progress=False)
+
+
+def test_streaming_reader_keeps_rows_around_a_ragged_row(tmp_path, ragged_csv):
+    assert read_data_list(str(ragged_csv), **read_options(tmp_path)) == RAGGED_ROWS
+
+
+def test_large_csv_pandas_path_keeps_rows_around_a_ragged_row(tmp_path, ragged_csv, monkeypatch):
+    pytest.importorskip("pandas")
+    monkeypatch.setattr(contractfillercli, "LARGE_CSV_BYTES", 0)
+    assert read_data(str(ragged_csv), as_list=True, **read_options(tmp_path)) == RAGGED_ROWS
+
+
+def test_large_csv_iteration_stays_streaming(tmp_path, ragged_csv, monkeypatch):
+    monkeypatch.setattr(contractfillercli, "LARGE_CSV_BYTES", 0)
+    rows = read_data(str(ragged_csv), **read_options(tmp_path))
+    assert not isinstance(rows, list)
+    assert list(rows) == RAGGED_ROWS
+
+
+def test_dataframe_path_keeps_rows_around_a_ragged_row(tmp_path, ragged_csv):
+    pytest.importorskip("pandas")
+    df = read_data(str(ragged_csv), return_dataframe=True, **read_options(tmp_path))
+    assert df.to_dict(orient="records") == RAGGED_ROWS
+
+
+def test_short_rows_read_the_same_on_every_path(tmp_path, monkeypatch):
+    pytest.importorskip("pandas")
+    path = tmp_path / "clients.csv"
+    path.write_text("name,surname,company\na,b\nc,,\n", encoding="utf-8")
+    expected = [
+        {"name": "a", "surname": "b", "company": ""},
+        {"name": "c", "surname": "", "company": ""},
+    ]
+    options = read_options(tmp_path)
+
+    assert read_data_list(str(path), **options) == expected
+    assert read_data(str(path), return_dataframe=True, **options).to_dict(orient="records") == expected
+    formatted = read_data(
+        str(path), return_dataframe=True, date_fields=["company"], date_formatter=str, **options
+    )
+    assert formatted.to_dict(orient="records") == expected
+    monkeypatch.setattr(contractfillercli, "LARGE_CSV_BYTES", 0)
+    assert read_data_list(str(path), **options) == expected